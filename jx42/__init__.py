@@ -1,5 +1,18 @@
 """JX-42 core package."""
 
-from .kernel import DefaultKernel
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .kernel import DefaultKernel
 
 __all__ = ["DefaultKernel"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved on first access (PEP 562) so importing a leaf submodule such as
+    # jx42.validation does not pull in the kernel and everything it imports.
+    if name == "DefaultKernel":
+        from .kernel import DefaultKernel
+
+        return DefaultKernel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
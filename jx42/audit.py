@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import replace
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from .models import AuditEvent
 
@@ -13,12 +13,25 @@ _SECRET_PATTERNS = [
     re.compile(r"(secret\s*[:=]\s*)(\S+)", re.IGNORECASE),
     re.compile(r"(sk-[A-Za-z0-9]{8,})"),
 ]
+# Replacement strings resolved once at import. The patterns are applied one
+# after another rather than merged into a single alternation: sequential passes
+# also catch a key whose value is itself a key ("secret=token: abc"), which a
+# single leftmost-match scan would leave partly unredacted.
+_SECRET_SUBSTITUTIONS = [
+    (pattern, r"\1[REDACTED]" if pattern.groups >= 2 else "[REDACTED]") for pattern in _SECRET_PATTERNS
+]
+# Matches wherever any of _SECRET_PATTERNS could; one scan rules out clean text.
+_SECRET_HINT = re.compile(r"password|token|api[_-]?key|secret|sk-", re.IGNORECASE)
 
 
 class AuditLog:
     def append(self, event: AuditEvent) -> str:
         raise NotImplementedError
 
+    def append_many(self, events: Iterable[AuditEvent]) -> List[str]:
+        """Append events in order; backends may override to write them as one batch."""
+        return [self.append(event) for event in events]
+
     def list_events(self, correlation_id: Optional[str] = None) -> List[AuditEvent]:
         raise NotImplementedError
 
@@ -39,18 +52,18 @@ class InMemoryAuditLog(AuditLog):
 
 
 def redact_text(text: str) -> str:
+    if not _SECRET_HINT.search(text):
+        return text
     redacted = text
-    for pattern in _SECRET_PATTERNS:
-        if pattern.groups >= 2:
-            redacted = pattern.sub(r"\1[REDACTED]", redacted)
-        else:
-            redacted = pattern.sub("[REDACTED]", redacted)
+    for pattern, replacement in _SECRET_SUBSTITUTIONS:
+        redacted = pattern.sub(replacement, redacted)
     return redacted
 
 
 def _redact_event(event: AuditEvent) -> AuditEvent:
-    return replace(
-        event,
-        inputs_summary=redact_text(event.inputs_summary),
-        outputs_summary=redact_text(event.outputs_summary),
-    )
+    inputs_summary = redact_text(event.inputs_summary)
+    outputs_summary = redact_text(event.outputs_summary)
+    # Clean or already-redacted events are returned as-is rather than copied.
+    if inputs_summary == event.inputs_summary and outputs_summary == event.outputs_summary:
+        return event
+    return replace(event, inputs_summary=inputs_summary, outputs_summary=outputs_summary)
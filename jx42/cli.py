@@ -214,13 +214,12 @@ def _handle_investing(args: argparse.Namespace, db_path: Path) -> int:
     _ensure_db_dir(db_path)
     market_store = SqliteMarketDataStore(db_path)
     ip = InvestingProgram()
-    for p in market_store.load_all():
-        ip._market_data.append(p)
+    ip.set_market_data(market_store.load_all())
 
     if args.investing_command == "load-market-data":
         try:
-            csv_text = Path(args.file).read_text(encoding="utf-8")
-            points = ip.load_market_csv(csv_text)
+            with open(args.file, encoding="utf-8", newline="") as handle:
+                points = ip.load_market_csv(handle)
             market_store.save(points)
             print(f"Loaded {len(points)} market data points.")
             return 0
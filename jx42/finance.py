@@ -68,6 +68,14 @@ class CsvImportError(ValueError):
     pass
 
 
+def _first_column(columns: Dict[str, int], *names: str) -> Optional[int]:
+    """Return the index of the first header in *names* present in *columns*."""
+    for name in names:
+        if name in columns:
+            return columns[name]
+    return None
+
+
 def import_csv(
     csv_text: str,
     account_id: str = "default",
@@ -85,39 +93,55 @@ def import_csv(
     if batch_id is None:
         batch_id = str(uuid.uuid4())
 
-    reader = csv.DictReader(io.StringIO(csv_text))
-    if reader.fieldnames is None:
+    reader = csv.reader(io.StringIO(csv_text))
+    header_row = next(reader, None)
+    if header_row is None:
         raise CsvImportError("CSV has no headers.")
 
-    headers = {h.strip().lower() for h in reader.fieldnames}
-    if "amount" not in headers:
+    # Resolve column positions once so each row is read by index rather than
+    # rebuilding a lower-cased dict per row. Later duplicates win, as with DictReader.
+    columns = {h.strip().lower(): idx for idx, h in enumerate(header_row)}
+    if "amount" not in columns:
         raise CsvImportError("CSV must have an 'amount' column.")
-    if "date" not in headers:
+    if "date" not in columns:
         raise CsvImportError("CSV must have a 'date' column.")
 
+    amount_idx = columns["amount"]
+    date_idx = columns["date"]
+    merchant_idx = _first_column(columns, "merchant", "description", "payee")
+    memo_idx = _first_column(columns, "memo", "notes")
+    currency_idx = columns.get("currency")
+    account_idx = columns.get("account_id")
+
+    def _cell(row: List[str], idx: Optional[int], default: str = "") -> str:
+        if idx is None:
+            return default
+        return row[idx].strip()
+
+    width = len(header_row)
     entries: List[FinanceLedgerEntry] = []
-    for i, row in enumerate(reader):
-        row_lower = {k.strip().lower(): v.strip() for k, v in row.items()}
+    for i, row in enumerate(r for r in reader if r):
+        # Columns are read by position, so a ragged row (e.g. an unquoted
+        # "1,000.50" amount) would silently shift every later field.
+        if len(row) != width:
+            raise CsvImportError(f"Row {i + 1}: expected {width} columns, got {len(row)}")
+        raw_amount = _cell(row, amount_idx)
         try:
-            amount = float(row_lower.get("amount", "0").replace(",", ""))
+            amount = float(raw_amount.replace(",", ""))
         except ValueError as exc:
-            raise CsvImportError(f"Row {i + 1}: invalid amount '{row_lower.get('amount')}'") from exc
-
-        raw_date = row_lower.get("date", "")
-        merchant = row_lower.get("merchant", row_lower.get("description", row_lower.get("payee", "")))
-        memo = row_lower.get("memo", row_lower.get("notes", ""))
-        currency = row_lower.get("currency", "USD")
-        acct = row_lower.get("account_id", account_id)
+            raise CsvImportError(f"Row {i + 1}: invalid amount '{raw_amount}'") from exc
 
+        merchant = _cell(row, merchant_idx)
+        memo = _cell(row, memo_idx)
         category, confidence = _categorize(merchant, memo)
 
         entries.append(
             FinanceLedgerEntry(
                 entry_id=id_factory(),
-                date=raw_date,
+                date=_cell(row, date_idx),
                 amount=amount,
-                currency=currency,
-                account_id=acct,
+                currency=_cell(row, currency_idx, "USD"),
+                account_id=_cell(row, account_idx, account_id),
                 merchant=merchant,
                 category=category,
                 category_confidence=confidence,
@@ -178,6 +202,47 @@ def reconcile(
 # ---------------------------------------------------------------------------
 
 _SPIKE_STD_MULTIPLIER = 2.0  # flag if > 2 std devs above category mean
+# Relative band in which the O(1) leave-one-out update is re-checked exactly
+_SPIKE_RECHECK_RTOL = 1e-9
+# Rounding in the leave-one-out update grows with the size of the amounts, so
+# "~zero spread" is also judged against mean**2, not only the group's m2.
+_SPIKE_SCALE_RTOL = 1e-12
+
+
+def _spike_flags(values: Sequence[float], k: float) -> List[bool]:
+    """Flag values more than k std devs above the mean of the *other* values.
+
+    Leave-one-out mean/variance are derived from the group's total mean and
+    sum of squared deviations, so a group costs O(n) instead of O(n^2).
+    Where that update is numerically delicate (the other values have ~zero
+    spread, or the value sits on the threshold) the exact computation is used,
+    so results match summing the other values directly.
+    """
+    n = len(values)
+    if n < 2:
+        return [False] * n
+    m = n - 1
+    mean = sum(values) / n
+    m2 = sum((v - mean) ** 2 for v in values)
+    zero_spread = max(m2 * _SPIKE_RECHECK_RTOL, n * mean * mean * _SPIKE_SCALE_RTOL)
+    flags: List[bool] = []
+    for i, v in enumerate(values):
+        d = v - mean
+        loo_m2 = m2 - d * d * n / m
+        threshold = mean - d / m + k * (max(loo_m2, 0.0) / m) ** 0.5
+        if loo_m2 <= zero_spread or abs(v - threshold) <= abs(threshold) * _SPIKE_RECHECK_RTOL:
+            flags.append(_spike_flag_exact(values, i, k))
+        else:
+            flags.append(v > threshold)
+    return flags
+
+
+def _spike_flag_exact(values: Sequence[float], i: int, k: float) -> bool:
+    others = [a for j, a in enumerate(values) if j != i]
+    mean = sum(others) / len(others)
+    variance = sum((a - mean) ** 2 for a in others) / len(others)
+    std: float = variance ** 0.5
+    return values[i] > mean + k * std and std > 0
 
 
 def detect_anomalies(entries: Sequence[FinanceLedgerEntry]) -> List[AnomalyAlert]:
@@ -193,18 +258,9 @@ def detect_anomalies(entries: Sequence[FinanceLedgerEntry]) -> List[AnomalyAlert
     for category, cat_entries in by_category.items():
         if len(cat_entries) < 2:
             continue
-        amounts = [abs(e.amount) for e in cat_entries]
-        for i, entry in enumerate(cat_entries):
-            # Compute mean/std from all other entries (leave-one-out) to avoid
-            # the outlier inflating the threshold
-            others = [a for j, a in enumerate(amounts) if j != i]
-            if not others:
-                continue
-            mean = sum(others) / len(others)
-            variance = sum((a - mean) ** 2 for a in others) / len(others)
-            std = variance ** 0.5
-            threshold = mean + _SPIKE_STD_MULTIPLIER * std
-            if abs(entry.amount) > threshold and std > 0:
+        flags = _spike_flags([-e.amount for e in cat_entries], _SPIKE_STD_MULTIPLIER)
+        for entry, flagged in zip(cat_entries, flags):
+            if flagged:
                 alerts.append(
                     AnomalyAlert(
                         entry_id=entry.entry_id,
@@ -216,16 +272,15 @@ def detect_anomalies(entries: Sequence[FinanceLedgerEntry]) -> List[AnomalyAlert
                 )
 
     # Subscription creep: flag categories whose total grows month-over-month
-    monthly: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    monthly: Dict[str, float] = defaultdict(float)
     for e in entries:
         if e.category == "subscriptions" and e.amount < 0:
-            month = e.date[:7]  # YYYY-MM
-            monthly[month]["subscriptions"] += abs(e.amount)
+            monthly[e.date[:7]] += abs(e.amount)  # YYYY-MM
 
     months = sorted(monthly.keys())
     for i in range(1, len(months)):
-        prev = monthly[months[i - 1]].get("subscriptions", 0.0)
-        curr = monthly[months[i]].get("subscriptions", 0.0)
+        prev = monthly[months[i - 1]]
+        curr = monthly[months[i]]
         if prev > 0 and curr > prev * 1.1:
             alerts.append(
                 AnomalyAlert(
@@ -253,12 +308,19 @@ def estimate_runway(
     """Estimate months of runway given current balance and average monthly burn."""
     if essential_categories is None:
         essential_categories = ["housing", "utilities", "groceries", "healthcare", "insurance"]
+    essential = set(essential_categories)
 
-    # Calculate average monthly burn (expenses only) over available months
+    # Calculate average monthly burn (expenses only) over available months,
+    # and the survival budget (essential categories only) in the same pass
     monthly_expenses: Dict[str, float] = defaultdict(float)
+    monthly_essential: Dict[str, float] = defaultdict(float)
     for e in entries:
-        if e.amount < 0:
-            monthly_expenses[e.date[:7]] += abs(e.amount)
+        amount = e.amount
+        if amount < 0:
+            month = e.date[:7]
+            monthly_expenses[month] += -amount
+            if e.category in essential:
+                monthly_essential[month] += -amount
 
     if not monthly_expenses:
         return RunwayEstimate(
@@ -271,12 +333,6 @@ def estimate_runway(
 
     avg_burn = sum(monthly_expenses.values()) / len(monthly_expenses)
 
-    # Survival budget = only essential categories
-    monthly_essential: Dict[str, float] = defaultdict(float)
-    for e in entries:
-        if e.amount < 0 and e.category in essential_categories:
-            monthly_essential[e.date[:7]] += abs(e.amount)
-
     survival_budget = (
         sum(monthly_essential.values()) / len(monthly_essential) if monthly_essential else avg_burn * 0.6
     )
@@ -15,9 +15,13 @@ from __future__ import annotations
 
 import csv
 import io
+import os
+import sys
 import uuid
-from collections import defaultdict
-from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from array import array
+from collections import defaultdict, deque
+from itertools import accumulate, repeat
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple, Union
 
 from .models import (
     BacktestResult,
@@ -38,37 +42,60 @@ class MarketDataError(ValueError):
     pass
 
 
-def load_market_data_csv(csv_text: str) -> List[MarketDataPoint]:
+_MARKET_DATA_COLUMNS = {"symbol", "date", "open", "high", "low", "close", "volume"}
+
+
+def load_market_data_csv(csv_text: Union[str, TextIO]) -> List[MarketDataPoint]:
     """Parse OHLCV CSV into MarketDataPoint objects.
 
     Required columns (case-insensitive): symbol, date, open, high, low, close, volume
+
+    ``csv_text`` may be the CSV contents or an open text stream (e.g. a file
+    opened with ``newline=""``); streams are read row by row, so the raw file
+    is never held in memory alongside the parsed points.
     """
-    reader = csv.DictReader(io.StringIO(csv_text))
-    if reader.fieldnames is None:
+    stream = io.StringIO(csv_text) if isinstance(csv_text, str) else csv_text
+    reader = csv.reader(stream)
+    header_row = next(reader, None)
+    if header_row is None:
         raise MarketDataError("Market data CSV has no headers.")
 
-    headers = {h.strip().lower() for h in reader.fieldnames}
-    required = {"symbol", "date", "open", "high", "low", "close", "volume"}
-    missing = required - headers
+    columns = {h.strip().lower(): idx for idx, h in enumerate(header_row)}
+    missing = _MARKET_DATA_COLUMNS - columns.keys()
     if missing:
         raise MarketDataError(f"Market data CSV missing columns: {missing}")
 
+    # Resolve column positions once; each row is then read by index.
+    sym_i, date_i, open_i, high_i, low_i, close_i, vol_i = (
+        columns[c] for c in ("symbol", "date", "open", "high", "low", "close", "volume")
+    )
+    width = len(header_row)
+
     points: List[MarketDataPoint] = []
-    for i, row in enumerate(reader):
-        r = {k.strip().lower(): v.strip() for k, v in row.items()}
+    # Raw symbol cell -> normalised, interned symbol. Points for one ticker then
+    # share a single string, and symbol comparisons short-circuit on identity.
+    symbols: Dict[str, str] = {}
+    for i, row in enumerate(r for r in reader if r):
+        # Cells are read by position, so a ragged row would shift every later field.
+        if len(row) != width:
+            raise MarketDataError(f"Row {i + 1}: expected {width} columns, got {len(row)}")
+        raw_symbol = row[sym_i]
+        symbol = symbols.get(raw_symbol)
+        if symbol is None:
+            symbol = symbols[raw_symbol] = sys.intern(raw_symbol.strip().upper())
         try:
             points.append(
                 MarketDataPoint(
-                    symbol=r["symbol"].upper(),
-                    date=r["date"],
-                    open=float(r["open"]),
-                    high=float(r["high"]),
-                    low=float(r["low"]),
-                    close=float(r["close"]),
-                    volume=float(r["volume"]),
+                    symbol=symbol,
+                    date=row[date_i].strip(),
+                    open=float(row[open_i]),
+                    high=float(row[high_i]),
+                    low=float(row[low_i]),
+                    close=float(row[close_i]),
+                    volume=float(row[vol_i]),
                 )
             )
-        except (ValueError, KeyError) as exc:
+        except ValueError as exc:
             raise MarketDataError(f"Row {i + 1}: {exc}") from exc
 
     return points
@@ -96,23 +123,34 @@ def check_data_integrity(points: Sequence[MarketDataPoint]) -> List[str]:
         by_symbol[p.symbol].append(p)
 
     for symbol, sym_points in by_symbol.items():
-        dates = [p.date for p in sym_points]
+        # One pass per symbol; messages are grouped as duplicates, ordering,
+        # then per-row OHLCV problems.
+        duplicate_errors: List[str] = []
+        row_errors: List[str] = []
         seen_dates: set = set()
+        unsorted = False
+        prev_date = ""
         for p in sym_points:
-            if p.date in seen_dates:
-                errors.append(f"{symbol} {p.date}: duplicate date.")
-            seen_dates.add(p.date)
-
-        if dates != sorted(dates):
-            errors.append(f"{symbol}: dates are not in ascending order.")
+            date = p.date
+            if date in seen_dates:
+                duplicate_errors.append(f"{symbol} {date}: duplicate date.")
+            seen_dates.add(date)
+            # ISO dates order lexically; a pairwise check replaces sorting a copy.
+            if date < prev_date:
+                unsorted = True
+            prev_date = date
 
-        for p in sym_points:
             if p.high < max(p.open, p.close, p.low):
-                errors.append(f"{symbol} {p.date}: high={p.high} < max(open, close, low).")
+                row_errors.append(f"{symbol} {date}: high={p.high} < max(open, close, low).")
             if p.low > min(p.open, p.close, p.high):
-                errors.append(f"{symbol} {p.date}: low={p.low} > min(open, close, high).")
+                row_errors.append(f"{symbol} {date}: low={p.low} > min(open, close, high).")
             if p.volume < 0:
-                errors.append(f"{symbol} {p.date}: negative volume.")
+                row_errors.append(f"{symbol} {date}: negative volume.")
+
+        errors.extend(duplicate_errors)
+        if unsorted:
+            errors.append(f"{symbol}: dates are not in ascending order.")
+        errors.extend(row_errors)
 
     return errors
 
@@ -124,10 +162,74 @@ def check_data_integrity(points: Sequence[MarketDataPoint]) -> List[str]:
 _MA_WINDOWS = {"sma_10": 10, "sma_20": 20, "sma_50": 50, "sma_200": 200}
 
 
-def _sma(closes: List[float], window: int) -> Optional[float]:
-    if len(closes) < window:
-        return None
-    return sum(closes[-window:]) / window
+def _rolling_mean(values: Sequence[float], window: int) -> List[Optional[float]]:
+    """Simple moving average per bar; None until *window* bars are available.
+
+    Each window is summed afresh rather than kept as a running total: add/subtract
+    drift would break exact SMA ties, which are common with cent-rounded prices,
+    and move crossover signals by a bar.
+    """
+    if window < 1:
+        raise ValueError(f"SMA window must be >= 1, got {window}")
+    out: List[Optional[float]] = [None] * min(window - 1, len(values))
+    for i in range(window - 1, len(values)):
+        out.append(sum(values[i - window + 1 : i + 1]) / window)
+    return out
+
+
+def _sma_cross_signals(fast: Sequence[Optional[float]], slow: Sequence[Optional[float]], above: bool) -> List[int]:
+    """Bar indices where the fast SMA crosses above (or below) the slow SMA."""
+    hits: List[int] = []
+    for i in range(1, len(fast)):
+        fast_now, slow_now, fast_prev, slow_prev = fast[i], slow[i], fast[i - 1], slow[i - 1]
+        if fast_now is None or slow_now is None or fast_prev is None or slow_prev is None:
+            continue
+        if above:
+            if fast_prev <= slow_prev and fast_now > slow_now:
+                hits.append(i)
+        elif fast_prev >= slow_prev and fast_now < slow_now:
+            hits.append(i)
+    return hits
+
+
+def _breakout_signals(highs: Sequence[float], closes: Sequence[float], window: int) -> List[Tuple[int, float]]:
+    """(bar index, prior N-bar high) where close exceeds the high of the previous *window* bars.
+
+    The running window max is kept in a monotonic deque, so each bar is O(1)
+    amortised instead of rescanning the window.
+    """
+    if window < 1:
+        raise ValueError(f"Breakout window must be >= 1, got {window}")
+    hits: List[Tuple[int, float]] = []
+    candidates: deque[int] = deque()  # indices into highs, values decreasing
+    for i in range(len(closes)):
+        if i >= window and i >= 1:
+            recent_high = highs[candidates[0]]
+            if closes[i] > recent_high:
+                hits.append((i, recent_high))
+        # Slide the window to cover highs[i - window + 1 : i + 1] for the next bar
+        while candidates and highs[candidates[-1]] <= highs[i]:
+            candidates.pop()
+        candidates.append(i)
+        if candidates[0] <= i - window:
+            candidates.popleft()
+    return hits
+
+
+def _trailing_stop_signals(highs: Sequence[float], closes: Sequence[float], pct: float) -> List[Tuple[int, float]]:
+    """(bar index, stop level) where close falls below the running high less *pct*.
+
+    The high-water mark is a running max (one pass) rather than max() over the
+    whole prefix at every bar.
+    """
+    hits: List[Tuple[int, float]] = []
+    for i, peak in enumerate(accumulate(highs, max)):
+        if i == 0:
+            continue
+        stop = peak * (1 - pct)
+        if closes[i] < stop:
+            hits.append((i, stop))
+    return hits
 
 
 def compute_signals(
@@ -150,92 +252,65 @@ def compute_signals(
     if not points:
         return []
 
-    closes = [p.close for p in points]
-    highs = [p.high for p in points]
-    signals: List[TradeSignal] = []
-
-    for i in range(1, len(points)):
-        p = points[i]
-        for rule in strategy.rules:
-            params = rule.parameters
-            indicator = params.get("indicator", "")
-
-            if rule.rule_type == "entry":
-                if indicator == "sma_crossover":
-                    fast_w = int(params.get("fast_window", 10))
-                    slow_w = int(params.get("slow_window", 50))
-                    fast_now = _sma(closes[: i + 1], fast_w)
-                    slow_now = _sma(closes[: i + 1], slow_w)
-                    fast_prev = _sma(closes[:i], fast_w)
-                    slow_prev = _sma(closes[:i], slow_w)
-                    if None not in (fast_now, slow_now, fast_prev, slow_prev):
-                        if fast_prev <= slow_prev and fast_now > slow_now:  # type: ignore[operator]
-                            signals.append(
-                                TradeSignal(
-                                    symbol=p.symbol,
-                                    date=p.date,
-                                    signal_type="entry",
-                                    rule_id=rule.rule_id,
-                                    score=0.8,
-                                    rationale=f"SMA({fast_w}) crossed above SMA({slow_w})",
-                                )
-                            )
-
-                elif indicator == "breakout":
-                    window = int(params.get("window", 20))
-                    if i >= window:
-                        recent_high = max(highs[i - window : i])
-                        if closes[i] > recent_high:
-                            signals.append(
-                                TradeSignal(
-                                    symbol=p.symbol,
-                                    date=p.date,
-                                    signal_type="entry",
-                                    rule_id=rule.rule_id,
-                                    score=0.7,
-                                    rationale=f"Close {closes[i]:.2f} > {window}-day high {recent_high:.2f}",
-                                )
-                            )
-
-            elif rule.rule_type == "exit":
-                if indicator == "sma_cross_below":
-                    fast_w = int(params.get("fast_window", 10))
-                    slow_w = int(params.get("slow_window", 50))
-                    fast_now = _sma(closes[: i + 1], fast_w)
-                    slow_now = _sma(closes[: i + 1], slow_w)
-                    fast_prev = _sma(closes[:i], fast_w)
-                    slow_prev = _sma(closes[:i], slow_w)
-                    if None not in (fast_now, slow_now, fast_prev, slow_prev):
-                        if fast_prev >= slow_prev and fast_now < slow_now:  # type: ignore[operator]
-                            signals.append(
-                                TradeSignal(
-                                    symbol=p.symbol,
-                                    date=p.date,
-                                    signal_type="exit",
-                                    rule_id=rule.rule_id,
-                                    score=0.8,
-                                    rationale=f"SMA({fast_w}) crossed below SMA({slow_w})",
-                                )
-                            )
-
-                elif indicator == "trailing_stop":
-                    pct = float(params.get("pct", 0.05))
-                    if i >= 1:
-                        recent_peak = max(highs[: i + 1])
-                        stop = recent_peak * (1 - pct)
-                        if closes[i] < stop:
-                            signals.append(
-                                TradeSignal(
-                                    symbol=p.symbol,
-                                    date=p.date,
-                                    signal_type="exit",
-                                    rule_id=rule.rule_id,
-                                    score=0.9,
-                                    rationale=f"Trailing stop hit: close {closes[i]:.2f} < stop {stop:.2f}",
-                                )
-                            )
-
-    return signals
+    # The indicators only read these two columns; packed doubles spare an
+    # attribute lookup per bar inside the kernels.
+    closes = array("d", [p.close for p in points])
+    highs = array("d", [p.high for p in points])
+
+    # Each SMA window is computed once over the whole series, not re-summed per bar.
+    sma_cache: Dict[int, List[Optional[float]]] = {}
+
+    def sma(window: int) -> List[Optional[float]]:
+        if window not in sma_cache:
+            sma_cache[window] = _rolling_mean(closes, window)
+        return sma_cache[window]
+
+    def signal(i: int, rule_id: str, signal_type: str, score: float, rationale: str) -> TradeSignal:
+        return TradeSignal(
+            symbol=points[i].symbol,
+            date=points[i].date,
+            signal_type=signal_type,
+            rule_id=rule_id,
+            score=score,
+            rationale=rationale,
+        )
+
+    # Evaluate each rule over the whole series, then emit in (bar, rule) order.
+    fired: List[Tuple[int, int, TradeSignal]] = []
+    for rule_idx, rule in enumerate(strategy.rules):
+        params = rule.parameters
+        indicator = params.get("indicator", "")
+
+        if rule.rule_type == "entry":
+            if indicator == "sma_crossover":
+                fast_w = int(params.get("fast_window", 10))
+                slow_w = int(params.get("slow_window", 50))
+                for i in _sma_cross_signals(sma(fast_w), sma(slow_w), above=True):
+                    rationale = f"SMA({fast_w}) crossed above SMA({slow_w})"
+                    fired.append((i, rule_idx, signal(i, rule.rule_id, "entry", 0.8, rationale)))
+
+            elif indicator == "breakout":
+                window = int(params.get("window", 20))
+                for i, recent_high in _breakout_signals(highs, closes, window):
+                    rationale = f"Close {closes[i]:.2f} > {window}-day high {recent_high:.2f}"
+                    fired.append((i, rule_idx, signal(i, rule.rule_id, "entry", 0.7, rationale)))
+
+        elif rule.rule_type == "exit":
+            if indicator == "sma_cross_below":
+                fast_w = int(params.get("fast_window", 10))
+                slow_w = int(params.get("slow_window", 50))
+                for i in _sma_cross_signals(sma(fast_w), sma(slow_w), above=False):
+                    rationale = f"SMA({fast_w}) crossed below SMA({slow_w})"
+                    fired.append((i, rule_idx, signal(i, rule.rule_id, "exit", 0.8, rationale)))
+
+            elif indicator == "trailing_stop":
+                pct = float(params.get("pct", 0.05))
+                for i, stop in _trailing_stop_signals(highs, closes, pct):
+                    rationale = f"Trailing stop hit: close {closes[i]:.2f} < stop {stop:.2f}"
+                    fired.append((i, rule_idx, signal(i, rule.rule_id, "exit", 0.9, rationale)))
+
+    fired.sort(key=lambda hit: (hit[0], hit[1]))
+    return [sig for _, _, sig in fired]
 
 
 # ---------------------------------------------------------------------------
@@ -243,10 +318,32 @@ def compute_signals(
 # ---------------------------------------------------------------------------
 
 
+def _signals_per_symbol(
+    by_symbol: Dict[str, List[MarketDataPoint]],
+    strategy: StrategyDefinition,
+    parallel: bool = False,
+) -> List[List[TradeSignal]]:
+    """compute_signals for each symbol, in by_symbol order.
+
+    With ``parallel`` and more than one symbol, symbols are fanned out to a
+    process pool. Each symbol's signals depend only on its own bars, so the
+    result is identical to the serial path; results come back in input order.
+    """
+    if not parallel or len(by_symbol) < 2:
+        return [compute_signals(points, strategy) for points in by_symbol.values()]
+    # Imported here: it pulls in multiprocessing, which the serial default never needs.
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(len(by_symbol), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(compute_signals, by_symbol.values(), repeat(strategy)))
+
+
 def run_backtest(
     market_data: Sequence[MarketDataPoint],
     strategy: StrategyDefinition,
     initial_capital: float = 100_000.0,
+    parallel: bool = False,
 ) -> BacktestResult:
     """Run a simple long-only backtest for the strategy universe.
 
@@ -255,6 +352,11 @@ def run_backtest(
     - Respects max_open_positions and max_position_size from strategy.
     - Applies kill-switch (stop trading) if drawdown exceeds max_drawdown_pct.
     - Returns BacktestResult with trades, total return, max drawdown, win rate.
+
+    ``parallel=True`` computes per-symbol signals in worker processes. Only
+    worth it for large multi-symbol universes, where signal computation
+    outweighs the cost of pickling bars to the workers. The portfolio
+    simulation shares capital across symbols and always runs serially.
     """
     by_symbol: Dict[str, List[MarketDataPoint]] = defaultdict(list)
     for p in market_data:
@@ -263,8 +365,8 @@ def run_backtest(
 
     # Pre-compute signals per symbol (no look-ahead: use data up to day i)
     all_signals: List[TradeSignal] = []
-    for symbol, points in by_symbol.items():
-        all_signals.extend(compute_signals(points, strategy))
+    for symbol_signals in _signals_per_symbol(by_symbol, strategy, parallel):
+        all_signals.extend(symbol_signals)
 
     # Build per-symbol signal lookup for simulation
     entry_dates: Dict[str, set] = defaultdict(set)
@@ -460,11 +562,15 @@ class InvestingProgram:
         self._market_data: List[MarketDataPoint] = []
         self._strategies: Dict[str, StrategyDefinition] = {}
 
-    def load_market_csv(self, csv_text: str) -> List[MarketDataPoint]:
+    def load_market_csv(self, csv_text: Union[str, TextIO]) -> List[MarketDataPoint]:
         points = load_market_data_csv(csv_text)
         self._market_data.extend(points)
         return points
 
+    def set_market_data(self, points: Iterable[MarketDataPoint]) -> None:
+        """Replace the loaded market data with already-parsed points (e.g. from storage)."""
+        self._market_data = list(points)
+
     def check_integrity(self) -> List[str]:
         return check_data_integrity(self._market_data)
 
@@ -482,9 +588,14 @@ class InvestingProgram:
             all_signals.extend(compute_signals(points, strategy))
         return all_signals
 
-    def backtest(self, strategy_id: str, initial_capital: float = 100_000.0) -> BacktestResult:
+    def backtest(
+        self,
+        strategy_id: str,
+        initial_capital: float = 100_000.0,
+        parallel: bool = False,
+    ) -> BacktestResult:
         strategy = self._strategies[strategy_id]
-        return run_backtest(self._market_data, strategy, initial_capital)
+        return run_backtest(self._market_data, strategy, initial_capital, parallel=parallel)
 
     def draft_tickets(
         self,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, Optional, Sequence
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence
 
 from .audit import AuditLog
 from .memory import MemoryLibrarian
@@ -61,10 +61,25 @@ class DefaultKernel(Kernel):
         if request is None or request.text is None or not str(request.text).strip():
             raise ValueError("UserRequest.text must be a non-empty string.")
         correlation_id = self._id_generator.new_uuid()
+        events: List[AuditEvent] = []
+        try:
+            response_text = self._process_request(request, correlation_id, events)
+        finally:
+            # Write the request's audit trail as one batch; flushed on errors too
+            # so events recorded before a failure are never dropped.
+            audit_ids = self._audit.append_many(events)
+        return KernelResponse(
+            correlation_id=correlation_id,
+            response_text=response_text,
+            audit_event_ids=audit_ids,
+        )
+
+    def _process_request(self, request: UserRequest, correlation_id: str, events: List[AuditEvent]) -> str:
         context_items = self._memory.retrieve(query=request.text, limit=3)
         plan = self._plan_request(request, context_items)
 
-        plan_event = self._emit_event(
+        self._emit_event(
+            events,
             correlation_id=correlation_id,
             component="kernel",
             action_type="plan_created",
@@ -81,7 +96,8 @@ class DefaultKernel(Kernel):
             if tool_decision.decision == PolicyDecisionType.DENY:
                 # If any tool call is denied, deny the entire request
                 decision = tool_decision
-                policy_event = self._emit_event(
+                self._emit_event(
+                    events,
                     correlation_id=correlation_id,
                     component="policy",
                     action_type="policy_decision",
@@ -93,7 +109,8 @@ class DefaultKernel(Kernel):
                 )
                 response_text = self._build_response(plan, decision)
                 response_text = self._apply_persona(response_text)
-                response_event = self._emit_event(
+                self._emit_event(
+                    events,
                     correlation_id=correlation_id,
                     component="kernel",
                     action_type="response_generated",
@@ -103,16 +120,12 @@ class DefaultKernel(Kernel):
                     policy_decision=decision.decision,
                     rationale="Response generated.",
                 )
-                audit_ids = [plan_event, policy_event, response_event]
-                return KernelResponse(
-                    correlation_id=correlation_id,
-                    response_text=response_text,
-                    audit_event_ids=audit_ids,
-                )
+                return response_text
 
         decision = self._policy.evaluate(plan.intent, tool_call=None)
 
-        policy_event = self._emit_event(
+        self._emit_event(
+            events,
             correlation_id=correlation_id,
             component="policy",
             action_type="policy_decision",
@@ -126,7 +139,8 @@ class DefaultKernel(Kernel):
         response_text = self._build_response(plan, decision)
         response_text = self._apply_persona(response_text)
 
-        response_event = self._emit_event(
+        self._emit_event(
+            events,
             correlation_id=correlation_id,
             component="kernel",
             action_type="response_generated",
@@ -136,13 +150,7 @@ class DefaultKernel(Kernel):
             policy_decision=decision.decision,
             rationale="Response generated.",
         )
-
-        audit_ids = [plan_event, policy_event, response_event]
-        return KernelResponse(
-            correlation_id=correlation_id,
-            response_text=response_text,
-            audit_event_ids=audit_ids,
-        )
+        return response_text
 
     def _plan_request(self, request: UserRequest, context_items: Sequence[object]) -> Plan:
         text = request.text.lower()
@@ -187,6 +195,7 @@ class DefaultKernel(Kernel):
 
     def _emit_event(
         self,
+        events: List[AuditEvent],
         correlation_id: str,
         component: str,
         action_type: str,
@@ -195,7 +204,8 @@ class DefaultKernel(Kernel):
         outputs_summary: str,
         policy_decision: PolicyDecisionType,
         rationale: str,
-    ) -> str:
+    ) -> None:
+        """Record an audit event for this request; handle_request flushes the batch."""
         event = AuditEvent(
             event_id=self._id_generator.new_uuid(),
             timestamp=self._time_provider(),
@@ -208,4 +218,4 @@ class DefaultKernel(Kernel):
             policy_decision=policy_decision,
             rationale=rationale,
         )
-        return self._audit.append(event)
+        events.append(event)
@@ -53,7 +53,7 @@ class Plan:
     tool_calls: List[ToolCall] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuditEvent:
     event_id: str
     timestamp: str
@@ -81,7 +81,7 @@ class AuditEvent:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemoryItem:
     item_id: str
     timestamp: str
@@ -110,7 +110,7 @@ def utc_now_iso() -> str:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class FinanceLedgerEntry:
     entry_id: str
     date: str  # YYYY-MM-DD
@@ -207,7 +207,7 @@ class StrategyDefinition:
     max_drawdown_pct: float = 0.10  # kill-switch threshold
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketDataPoint:
     symbol: str
     date: str  # YYYY-MM-DD
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional
 
 from .models import Intent, PolicyDecisionType, RiskLevel, ToolCall
 
@@ -18,39 +18,41 @@ class PolicyGuardian:
         raise NotImplementedError
 
 
+# Decisions are frozen, so each outcome is built once and shared across calls.
+_UNKNOWN_TOOL_DECISION = PolicyDecision(
+    decision=PolicyDecisionType.DENY,
+    risk_level=RiskLevel.HIGH,
+    rationale="Unknown tool call denied by default.",
+)
+_INTENT_DECISIONS: Dict[Intent, PolicyDecision] = {
+    Intent.MONEY_MOVE: PolicyDecision(
+        decision=PolicyDecisionType.DENY,
+        risk_level=RiskLevel.HIGH,
+        rationale="Money movement is blocked in v1.",
+    ),
+    Intent.INVESTING_TRADE_REQUEST: PolicyDecision(
+        decision=PolicyDecisionType.ALLOW,
+        risk_level=RiskLevel.MEDIUM,
+        rationale="Draft-only investing outputs are allowed.",
+    ),
+    Intent.FINANCE_REPORT_REQUEST: PolicyDecision(
+        decision=PolicyDecisionType.ALLOW,
+        risk_level=RiskLevel.LOW,
+        rationale="Finance summaries are allowed.",
+    ),
+}
+_DEFAULT_DECISION = PolicyDecision(
+    decision=PolicyDecisionType.ALLOW,
+    risk_level=RiskLevel.LOW,
+    rationale="General requests are allowed.",
+)
+
+
 class DefaultPolicyGuardian(PolicyGuardian):
     def __init__(self) -> None:
-        self._allowed_tools: set[str] = set()
+        self._allowed_tools: frozenset[str] = frozenset()
 
     def evaluate(self, intent: Intent, tool_call: Optional[ToolCall] = None) -> PolicyDecision:
-        if tool_call is not None:
-            if tool_call.name not in self._allowed_tools:
-                return PolicyDecision(
-                    decision=PolicyDecisionType.DENY,
-                    risk_level=RiskLevel.HIGH,
-                    rationale="Unknown tool call denied by default.",
-                )
-
-        if intent == Intent.MONEY_MOVE:
-            return PolicyDecision(
-                decision=PolicyDecisionType.DENY,
-                risk_level=RiskLevel.HIGH,
-                rationale="Money movement is blocked in v1.",
-            )
-        if intent == Intent.INVESTING_TRADE_REQUEST:
-            return PolicyDecision(
-                decision=PolicyDecisionType.ALLOW,
-                risk_level=RiskLevel.MEDIUM,
-                rationale="Draft-only investing outputs are allowed.",
-            )
-        if intent == Intent.FINANCE_REPORT_REQUEST:
-            return PolicyDecision(
-                decision=PolicyDecisionType.ALLOW,
-                risk_level=RiskLevel.LOW,
-                rationale="Finance summaries are allowed.",
-            )
-        return PolicyDecision(
-            decision=PolicyDecisionType.ALLOW,
-            risk_level=RiskLevel.LOW,
-            rationale="General requests are allowed.",
-        )
+        if tool_call is not None and tool_call.name not in self._allowed_tools:
+            return _UNKNOWN_TOOL_DECISION
+        return _INTENT_DECISIONS.get(intent, _DEFAULT_DECISION)
@@ -1,14 +1,19 @@
 """SQLite-backed persistent storage for AuditLog and MemoryLibrarian.
 
 Uses only Python stdlib (sqlite3) — no external dependencies.
-Thread-safety: each call opens a short-lived connection; suitable for
-single-process use (not multi-process concurrent writes).
+Thread-safety: each store holds one connection for its lifetime, shared
+across threads and serialised by a per-instance lock.  Separate instances
+(or processes) on the same file coordinate through WAL mode and the busy
+timeout.  Call close() when done to release the connection.
 """
 from __future__ import annotations
 
 import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 from .audit import AuditLog, _redact_event
 from .memory import MemoryLibrarian
@@ -21,6 +26,107 @@ from .models import (
     RiskLevel,
 )
 
+
+def _run_maintenance(conn: sqlite3.Connection) -> None:
+    """Refresh planner statistics and fold the WAL back into the main database.
+
+    Cheap on small databases; can take seconds on large ones, so call it at
+    shutdown or from a periodic job rather than on the request path.
+    """
+    conn.execute("PRAGMA optimize")
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+# How long a writer waits on a locked database before raising "database is locked".
+_BUSY_TIMEOUT_SECONDS = 5.0
+
+# Negative cache_size is in KiB: ~64 MB page cache per connection.
+_CACHE_SIZE_KIB = 64000
+
+
+class _SqliteStore:
+    """Base for the SQLite stores: one long-lived connection per instance.
+
+    Subclasses set ``_DDL`` and may extend ``_init_db``.  All access goes
+    through ``_read`` / ``_write_transaction``, which hold ``self._lock`` so
+    the shared connection is never used by two threads at once.
+    """
+
+    _DDL = ""
+
+    def __init__(self, db_path: str | Path) -> None:
+        self._db_path = str(db_path)
+        self._lock = threading.Lock()
+        # Autocommit mode: transactions are opened explicitly by _write_transaction.
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(
+            self._db_path,
+            timeout=_BUSY_TIMEOUT_SECONDS,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        # journal_mode is persistent in the database file; the rest are per connection.
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode NORMAL only syncs at checkpoints, not on every commit.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute(f"PRAGMA cache_size=-{_CACHE_SIZE_KIB}")
+        self._init_db(self._conn)
+
+    def _init_db(self, conn: sqlite3.Connection) -> None:
+        conn.executescript(self._DDL)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            raise sqlite3.ProgrammingError(f"{type(self).__name__} is closed")
+        return self._conn
+
+    @contextmanager
+    def _read(self) -> Iterator[sqlite3.Connection]:
+        """Yield the shared connection for reads, holding the instance lock."""
+        with self._lock:
+            yield self._connection()
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        """Yield the shared connection inside a BEGIN IMMEDIATE transaction.
+
+        Taking the write lock up front avoids the deferred SHARED -> RESERVED
+        upgrade, which fails immediately under contention instead of waiting
+        on the busy timeout.
+        """
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def maintenance(self) -> None:
+        """Run PRAGMA optimize and truncate the WAL (see _run_maintenance)."""
+        with self._lock:
+            _run_maintenance(self._connection())
+
+    def close(self) -> None:
+        """Run maintenance and close the connection. Safe to call more than once."""
+        with self._lock:
+            conn, self._conn = self._conn, None
+            if conn is None:
+                return
+            try:
+                _run_maintenance(conn)
+            finally:
+                conn.close()
+
+    def __del__(self) -> None:
+        # Best-effort release if close() was never called; skip maintenance here.
+        conn = getattr(self, "_conn", None)
+        if conn is not None:
+            conn.close()
+
+
 # ---------------------------------------------------------------------------
 # SQLite AuditLog
 # ---------------------------------------------------------------------------
@@ -38,75 +144,104 @@ CREATE TABLE IF NOT EXISTS audit_events (
     policy_decision TEXT NOT NULL,
     rationale       TEXT NOT NULL
 );
-CREATE INDEX IF NOT EXISTS idx_audit_correlation ON audit_events(correlation_id);
+-- Serves list_events(correlation_id=...) as one range seek already in
+-- (timestamp, event_id) order, so no sort step. It supersedes the older
+-- single-column idx_audit_correlation, which is dropped from existing files.
+CREATE INDEX IF NOT EXISTS idx_audit_corr_ts ON audit_events(correlation_id, timestamp, event_id);
+DROP INDEX IF EXISTS idx_audit_correlation;
+"""
+
+_INSERT_AUDIT_SQL = """
+INSERT OR IGNORE INTO audit_events
+    (event_id, timestamp, correlation_id, component, action_type,
+     risk_level, inputs_summary, outputs_summary, policy_decision, rationale)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
 """
 
+# Explicit column order for reads; rows are unpacked positionally in _row_to_audit_event.
+_AUDIT_SELECT = (
+    "SELECT event_id, timestamp, correlation_id, component, action_type, risk_level,"
+    " inputs_summary, outputs_summary, policy_decision, rationale FROM audit_events"
+)
 
-class SqliteAuditLog(AuditLog):
-    """Persistent append-only audit log backed by SQLite."""
+# Direct value -> member lookups for row decoding, skipping the Enum call machinery.
+_RISK_BY_VALUE = {r.value: r for r in RiskLevel}
+_POLICY_BY_VALUE = {p.value: p for p in PolicyDecisionType}
 
-    def __init__(self, db_path: str | Path) -> None:
-        self._db_path = str(db_path)
-        self._init_db()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+class SqliteAuditLog(_SqliteStore, AuditLog):
+    """Persistent append-only audit log backed by SQLite."""
 
-    def _init_db(self) -> None:
-        with self._connect() as conn:
-            conn.executescript(_AUDIT_DDL)
+    _DDL = _AUDIT_DDL
 
     def append(self, event: AuditEvent) -> str:
         redacted = _redact_event(event)
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO audit_events
-                    (event_id, timestamp, correlation_id, component, action_type,
-                     risk_level, inputs_summary, outputs_summary, policy_decision, rationale)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    redacted.event_id,
-                    redacted.timestamp,
-                    redacted.correlation_id,
-                    redacted.component,
-                    redacted.action_type,
-                    redacted.risk_level.value,
-                    redacted.inputs_summary,
-                    redacted.outputs_summary,
-                    redacted.policy_decision.value,
-                    redacted.rationale,
-                ),
-            )
+        with self._write_transaction() as conn:
+            conn.execute(_INSERT_AUDIT_SQL, _audit_event_row(redacted))
         return redacted.event_id
 
+    def append_many(self, events: Iterable[AuditEvent]) -> List[str]:
+        """Append a batch of events in a single transaction.
+
+        Commits once for the whole batch instead of once per event. If any
+        insert fails, the whole batch is rolled back.
+        """
+        redacted = [_redact_event(e) for e in events]
+        with self._write_transaction() as conn:
+            conn.executemany(_INSERT_AUDIT_SQL, [_audit_event_row(e) for e in redacted])
+        return [e.event_id for e in redacted]
+
     def list_events(self, correlation_id: Optional[str] = None) -> List[AuditEvent]:
-        with self._connect() as conn:
+        with self._read() as conn:
             if correlation_id is None:
-                cursor = conn.execute("SELECT * FROM audit_events ORDER BY timestamp, event_id")
+                cursor = conn.execute(f"{_AUDIT_SELECT} ORDER BY timestamp, event_id")
             else:
                 cursor = conn.execute(
-                    "SELECT * FROM audit_events WHERE correlation_id = ? ORDER BY timestamp, event_id",
+                    f"{_AUDIT_SELECT} WHERE correlation_id = ? ORDER BY timestamp, event_id",
                     (correlation_id,),
                 )
             return [_row_to_audit_event(row) for row in cursor.fetchall()]
 
 
-def _row_to_audit_event(row: sqlite3.Row) -> AuditEvent:
+def _audit_event_row(event: AuditEvent) -> tuple:
+    return (
+        event.event_id,
+        event.timestamp,
+        event.correlation_id,
+        event.component,
+        event.action_type,
+        event.risk_level.value,
+        event.inputs_summary,
+        event.outputs_summary,
+        event.policy_decision.value,
+        event.rationale,
+    )
+
+
+def _row_to_audit_event(row: tuple) -> AuditEvent:
+    (
+        event_id,
+        timestamp,
+        correlation_id,
+        component,
+        action_type,
+        risk_level,
+        inputs_summary,
+        outputs_summary,
+        policy_decision,
+        rationale,
+    ) = row
     return AuditEvent(
-        event_id=row["event_id"],
-        timestamp=row["timestamp"],
-        correlation_id=row["correlation_id"],
-        component=row["component"],
-        action_type=row["action_type"],
-        risk_level=RiskLevel(row["risk_level"]),
-        inputs_summary=row["inputs_summary"],
-        outputs_summary=row["outputs_summary"],
-        policy_decision=PolicyDecisionType(row["policy_decision"]),
-        rationale=row["rationale"],
+        event_id=event_id,
+        timestamp=timestamp,
+        correlation_id=correlation_id,
+        component=component,
+        action_type=action_type,
+        risk_level=_RISK_BY_VALUE[risk_level],
+        inputs_summary=inputs_summary,
+        outputs_summary=outputs_summary,
+        policy_decision=_POLICY_BY_VALUE[policy_decision],
+        rationale=rationale,
     )
 
 
@@ -125,53 +260,118 @@ CREATE TABLE IF NOT EXISTS memory_items (
 CREATE INDEX IF NOT EXISTS idx_memory_timestamp ON memory_items(timestamp);
 """
 
+# Trigram full-text index over memory content.  An external-content table
+# stores only the index; triggers keep it in step with memory_items.  The
+# trigram tokenizer matches arbitrary substrings (case-insensitively), so
+# retrieve() keeps the same semantics as the LIKE scan it replaces.
+# Run one statement at a time inside _init_fts's transaction (executescript
+# would commit first). 'rebuild' indexes any rows written before the index.
+_MEMORY_FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS memory_fts USING fts5(
+        content, content='memory_items', content_rowid='rowid', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS memory_items_ai AFTER INSERT ON memory_items BEGIN
+        INSERT INTO memory_fts(rowid, content) VALUES (new.rowid, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS memory_items_ad AFTER DELETE ON memory_items BEGIN
+        INSERT INTO memory_fts(memory_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS memory_items_au AFTER UPDATE ON memory_items BEGIN
+        INSERT INTO memory_fts(memory_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+        INSERT INTO memory_fts(rowid, content) VALUES (new.rowid, new.content);
+    END
+    """,
+    "INSERT INTO memory_fts(memory_fts) VALUES ('rebuild')",
+)
+# OperationalError messages meaning this SQLite build cannot provide the index.
+_FTS_UNAVAILABLE_ERRORS = ("no such module: fts5", "no such tokenizer")
 
-class SqliteMemoryLibrarian(MemoryLibrarian):
-    """Persistent memory store backed by SQLite."""
+# Trigram queries need at least three characters; shorter ones use LIKE.
+_FTS_MIN_QUERY_LEN = 3
 
-    def __init__(self, db_path: str | Path) -> None:
-        self._db_path = str(db_path)
-        self._init_db()
+_MEMORY_SELECT = "SELECT item_id, timestamp, item_type, content, provenance FROM memory_items"
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
 
-    def _init_db(self) -> None:
-        with self._connect() as conn:
-            conn.executescript(_MEMORY_DDL)
+class SqliteMemoryLibrarian(_SqliteStore, MemoryLibrarian):
+    """Persistent memory store backed by SQLite."""
+
+    _DDL = _MEMORY_DDL
+
+    def _init_db(self, conn: sqlite3.Connection) -> None:
+        super()._init_db(conn)
+        self._fts = self._init_fts(conn)
+
+    @staticmethod
+    def _init_fts(conn: sqlite3.Connection) -> bool:
+        """Create the trigram index if missing; return False if FTS5 is unavailable."""
+        # The write lock serialises the existence check and creation across
+        # connections opening the same fresh database.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memory_fts'"
+            ).fetchone()
+            if not exists:
+                for statement in _MEMORY_FTS_DDL:
+                    conn.execute(statement)
+        except sqlite3.OperationalError as exc:
+            conn.execute("ROLLBACK")
+            # SQLite built without FTS5 or older than 3.34 (no trigram tokenizer).
+            if any(msg in str(exc) for msg in _FTS_UNAVAILABLE_ERRORS):
+                return False
+            raise
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return True
 
     def store(self, items) -> List[str]:  # type: ignore[override]
-        stored_ids: List[str] = []
-        with self._connect() as conn:
-            for item in items:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO memory_items
-                        (item_id, timestamp, item_type, content, provenance)
-                    VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (item.item_id, item.timestamp, item.item_type, item.content, item.provenance),
-                )
-                stored_ids.append(item.item_id)
-        return stored_ids
+        items = list(items)
+        # Duplicates are dropped by the primary key; no existence check needed.
+        with self._write_transaction() as conn:
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO memory_items
+                    (item_id, timestamp, item_type, content, provenance)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [(item.item_id, item.timestamp, item.item_type, item.content, item.provenance) for item in items],
+            )
+        return [item.item_id for item in items]
 
     def retrieve(self, query: Optional[str] = None, limit: int = 5) -> List[MemoryItem]:
         if limit < 0:
             raise ValueError("limit must be non-negative")
-        with self._connect() as conn:
+        with self._read() as conn:
             if query is None:
                 cursor = conn.execute(
-                    "SELECT * FROM memory_items ORDER BY timestamp, item_id LIMIT ?",
+                    f"{_MEMORY_SELECT} ORDER BY timestamp, item_id LIMIT ?",
                     (limit,),
                 )
+            elif self._fts and len(query) >= _FTS_MIN_QUERY_LEN:
+                # Quote the query as a single FTS5 phrase so operators and
+                # punctuation in user input are matched literally.
+                phrase = '"' + query.replace('"', '""') + '"'
+                cursor = conn.execute(
+                    f"{_MEMORY_SELECT}"
+                    " WHERE rowid IN (SELECT rowid FROM memory_fts WHERE memory_fts MATCH ?)"
+                    " ORDER BY timestamp, item_id LIMIT ?",
+                    (phrase, limit),
+                )
             else:
                 # Escape LIKE metacharacters in the user-supplied query so that
                 # literal '%' and '_' characters are not treated as wildcards.
                 escaped = query.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
                 cursor = conn.execute(
-                    "SELECT * FROM memory_items"
+                    f"{_MEMORY_SELECT}"
                     " WHERE lower(content) LIKE ? ESCAPE '\\'"
                     " ORDER BY timestamp, item_id LIMIT ?",
                     (f"%{escaped}%", limit),
@@ -179,13 +379,14 @@ class SqliteMemoryLibrarian(MemoryLibrarian):
             return [_row_to_memory_item(row) for row in cursor.fetchall()]
 
 
-def _row_to_memory_item(row: sqlite3.Row) -> MemoryItem:
+def _row_to_memory_item(row: tuple) -> MemoryItem:
+    item_id, timestamp, item_type, content, provenance = row
     return MemoryItem(
-        item_id=row["item_id"],
-        timestamp=row["timestamp"],
-        item_type=row["item_type"],
-        content=row["content"],
-        provenance=row["provenance"],
+        item_id=item_id,
+        timestamp=timestamp,
+        item_type=item_type,
+        content=content,
+        provenance=provenance,
     )
 
 
@@ -212,44 +413,39 @@ CREATE INDEX IF NOT EXISTS idx_ledger_date ON finance_ledger(date);
 """
 
 
-class SqliteFinanceLedger:
+class SqliteFinanceLedger(_SqliteStore):
     """Persistent finance ledger backed by SQLite."""
 
-    def __init__(self, db_path: str | Path) -> None:
-        self._db_path = str(db_path)
-        self._init_db()
+    _DDL = _FINANCE_LEDGER_DDL
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
+    def _init_db(self, conn: sqlite3.Connection) -> None:
+        super()._init_db(conn)
         conn.row_factory = sqlite3.Row
-        return conn
-
-    def _init_db(self) -> None:
-        with self._connect() as conn:
-            conn.executescript(_FINANCE_LEDGER_DDL)
 
     def save(self, entries: List[FinanceLedgerEntry]) -> None:
         """Persist entries, silently skipping duplicates (idempotent on entry_id)."""
-        with self._connect() as conn:
-            for e in entries:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO finance_ledger
-                        (entry_id, date, amount, currency, account_id,
-                         merchant, category, category_confidence,
-                         memo, source, import_batch_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+        with self._write_transaction() as conn:
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO finance_ledger
+                    (entry_id, date, amount, currency, account_id,
+                     merchant, category, category_confidence,
+                     memo, source, import_batch_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         e.entry_id, e.date, e.amount, e.currency, e.account_id,
                         e.merchant, e.category, e.category_confidence,
                         e.memo, e.source, e.import_batch_id,
-                    ),
-                )
+                    )
+                    for e in entries
+                ],
+            )
 
     def load_all(self) -> List[FinanceLedgerEntry]:
         """Return all ledger entries ordered by date then entry_id."""
-        with self._connect() as conn:
+        with self._read() as conn:
             cursor = conn.execute(
                 "SELECT * FROM finance_ledger ORDER BY date, entry_id"
             )
@@ -291,38 +487,30 @@ CREATE INDEX IF NOT EXISTS idx_market_symbol ON market_data(symbol);
 """
 
 
-class SqliteMarketDataStore:
+class SqliteMarketDataStore(_SqliteStore):
     """Persistent market data store backed by SQLite."""
 
-    def __init__(self, db_path: str | Path) -> None:
-        self._db_path = str(db_path)
-        self._init_db()
+    _DDL = _MARKET_DATA_DDL
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self._db_path)
+    def _init_db(self, conn: sqlite3.Connection) -> None:
+        super()._init_db(conn)
         conn.row_factory = sqlite3.Row
-        return conn
-
-    def _init_db(self) -> None:
-        with self._connect() as conn:
-            conn.executescript(_MARKET_DATA_DDL)
 
     def save(self, points: List[MarketDataPoint]) -> None:
         """Persist data points, silently skipping duplicates (idempotent on symbol+date)."""
-        with self._connect() as conn:
-            for p in points:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO market_data
-                        (symbol, date, open, high, low, close, volume)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (p.symbol, p.date, p.open, p.high, p.low, p.close, p.volume),
-                )
+        with self._write_transaction() as conn:
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO market_data
+                    (symbol, date, open, high, low, close, volume)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [(p.symbol, p.date, p.open, p.high, p.low, p.close, p.volume) for p in points],
+            )
 
     def load_all(self) -> List[MarketDataPoint]:
         """Return all market data points ordered by symbol then date."""
-        with self._connect() as conn:
+        with self._read() as conn:
             cursor = conn.execute(
                 "SELECT * FROM market_data ORDER BY symbol, date"
             )
@@ -331,7 +519,7 @@ class SqliteMarketDataStore:
 
 def _row_to_market_data_point(row: sqlite3.Row) -> MarketDataPoint:
     return MarketDataPoint(
-        symbol=row["symbol"],
+        symbol=sys.intern(row["symbol"]),
         date=row["date"],
         open=row["open"],
         high=row["high"],
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import json
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, cast
+
+if TYPE_CHECKING:
+    from .models import AuditEvent, FinanceLedgerEntry, InvestingTradeTicketDraft
 
 SCHEMA_DIR = Path(__file__).resolve().parents[1] / "schemas"
 
@@ -21,19 +26,149 @@ def load_schema(name: str) -> Dict[str, Any]:
         raise ValueError(f"Invalid JSON in schema file: {path}") from exc
 
 
+@lru_cache(maxsize=None)
+def _cached_schema(name: str) -> Dict[str, Any]:
+    """Load a schema once per process; callers must treat the result as read-only."""
+    return load_schema(name)
+
+
+Validator = Callable[[Dict[str, Any]], List[str]]
+StructValidator = Callable[[Any], List[str]]
+# Appends a property's errors for one value to the given list.
+_PropertyCheck = Callable[[Any, List[str]], None]
+
+_TYPE_CHECKERS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "boolean": lambda v: isinstance(v, bool),
+}
+
+
+def _type_checker(expected_type: Any) -> Optional[Callable[[Any], bool]]:
+    """Predicate for a schema "type"; None means no check (unknown or union types)."""
+    if not isinstance(expected_type, str):
+        return None
+    return _TYPE_CHECKERS.get(expected_type)
+
+
+def _compile_property(field: str, rules: Dict[str, Any]) -> _PropertyCheck:
+    """Resolve one property's rules into a closure that appends its errors.
+
+    Type checker lookup, enum membership values and error messages are all
+    fixed here, so applying the rule does no schema lookups.
+    """
+    expected_type: Any = rules.get("type")
+    checker: Optional[Callable[[Any], bool]] = _type_checker(expected_type)
+    type_error: str = f"Field {field} expected {expected_type}"
+    enum: Optional[List[Any]] = rules.get("enum")
+    enum_error: str = f"Field {field} must be one of {enum}"
+    minimum: Optional[float] = rules.get("minimum")
+    maximum: Optional[float] = rules.get("maximum")
+    minimum_error: str = f"Field {field} must be >= {minimum}"
+    maximum_error: str = f"Field {field} must be <= {maximum}"
+    has_bounds: bool = minimum is not None or maximum is not None
+
+    def check(value: Any, errors: List[str]) -> None:
+        if checker is not None and not checker(value):
+            errors.append(type_error)
+        if enum is not None and value not in enum:
+            errors.append(enum_error)
+
+        # Enforce basic numeric constraints if defined in the schema.
+        # This aligns with JSON Schema's "minimum" and "maximum" keywords.
+        if has_bounds and isinstance(value, (int, float)) and not isinstance(value, bool):
+            if minimum is not None and value < minimum:
+                errors.append(minimum_error)
+            if maximum is not None and value > maximum:
+                errors.append(maximum_error)
+
+    return check
+
+
+def compile_schema(schema: Dict[str, Any]) -> Validator:
+    """Compile a schema into a validator function with the same results as validate_required_fields.
+
+    The schema is walked once here; the returned function only runs the
+    resolved checks against each payload.
+    """
+    # (field, message) pairs: failures append a prebuilt string, no formatting per call.
+    required: Tuple[Tuple[str, str], ...] = tuple(
+        (sys.intern(field), f"Missing required field: {field}") for field in schema.get("required", [])
+    )
+    properties: Tuple[Tuple[str, _PropertyCheck], ...] = tuple(
+        (sys.intern(field), _compile_property(field, rules)) for field, rules in schema.get("properties", {}).items()
+    )
+
+    def validate(payload: Dict[str, Any]) -> List[str]:
+        errors: List[str] = []
+        for field, missing_error in required:
+            if field not in payload:
+                errors.append(missing_error)
+        for field, check in properties:
+            if field in payload:
+                check(payload[field], errors)
+        return errors
+
+    return validate
+
+
+def _compile_struct_schema(schema: Dict[str, Any]) -> StructValidator:
+    """Like compile_schema, but reads fields as attributes of a model instance.
+
+    A field counts as missing when the attribute is absent or None, so unset
+    Optional fields (e.g. a ticket's ``qty``) are skipped rather than failing
+    the type check the way a None value in a dict payload would.
+    """
+    required: Tuple[Tuple[str, str], ...] = tuple(
+        (sys.intern(field), f"Missing required field: {field}") for field in schema.get("required", [])
+    )
+    properties: Tuple[Tuple[str, _PropertyCheck], ...] = tuple(
+        (sys.intern(field), _compile_property(field, rules)) for field, rules in schema.get("properties", {}).items()
+    )
+
+    def validate(obj: Any) -> List[str]:
+        errors: List[str] = []
+        for field, missing_error in required:
+            if getattr(obj, field, None) is None:
+                errors.append(missing_error)
+        for field, check in properties:
+            value: Any = getattr(obj, field, None)
+            if value is not None:
+                check(value, errors)
+        return errors
+
+    return validate
+
+
+@lru_cache(maxsize=None)
+def _compiled_validator(name: str) -> Validator:
+    return compile_schema(_cached_schema(name))
+
+
+@lru_cache(maxsize=None)
+def _compiled_struct_validator(name: str) -> StructValidator:
+    return _compile_struct_schema(_cached_schema(name))
+
+
 def validate_required_fields(payload: Dict[str, Any], schema: Dict[str, Any]) -> List[str]:
+    """Validate a payload against a schema in one pass, without compiling it.
+
+    Suited to one-off schemas; for a schema applied repeatedly, compile it once
+    with compile_schema. Both produce the same errors in the same order.
+    """
     errors: List[str] = []
-    required = schema.get("required", [])
-    for field in required:
+    for field in schema.get("required", []):
         if field not in payload:
             errors.append(f"Missing required field: {field}")
-    properties = schema.get("properties", {})
-    for field, rules in properties.items():
+    for field, rules in schema.get("properties", {}).items():
         if field not in payload:
             continue
         value = payload[field]
         expected_type = rules.get("type")
-        if expected_type and not _matches_type(value, expected_type):
+        checker = _type_checker(expected_type)
+        if checker is not None and not checker(value):
             errors.append(f"Field {field} expected {expected_type}")
         if "enum" in rules and value not in rules["enum"]:
             errors.append(f"Field {field} must be one of {rules['enum']}")
@@ -51,29 +186,54 @@ def validate_required_fields(payload: Dict[str, Any], schema: Dict[str, Any]) ->
 
 
 def validate_audit_event(payload: Dict[str, Any]) -> List[str]:
-    schema = load_schema("audit_event.schema.json")
-    return validate_required_fields(payload, schema)
+    return _compiled_validator("audit_event.schema.json")(payload)
+
+
+def validate_audit_event_bytes(raw: bytes | str) -> List[str]:
+    """Parse and validate a JSON-encoded audit event (e.g. a request body)."""
+    try:
+        payload = json.loads(raw)
+    # JSONDecodeError and UnicodeDecodeError are ValueErrors; RecursionError
+    # comes from pathologically nested bodies.
+    except (ValueError, RecursionError) as exc:
+        return [f"Invalid JSON payload: {exc}"]
+    if not isinstance(payload, dict):
+        return ["Payload must be a JSON object"]
+    return _compiled_validator("audit_event.schema.json")(payload)
+
+
+def validate_audit_events_batch(payloads: Iterable[Dict[str, Any]]) -> List[List[str]]:
+    """Validate many audit event payloads; one error list per payload, in input order."""
+    validate = _compiled_validator("audit_event.schema.json")
+    return [validate(payload) for payload in payloads]
 
 
 def validate_finance_ledger_entry(payload: Dict[str, Any]) -> List[str]:
-    schema = load_schema("finance_ledger.schema.json")
-    return validate_required_fields(payload, schema)
+    return _compiled_validator("finance_ledger.schema.json")(payload)
+
+
+def validate_finance_ledger_entries_batch(payloads: Iterable[Dict[str, Any]]) -> List[List[str]]:
+    """Validate many ledger entry payloads (e.g. a bank export); one error list per payload, in input order."""
+    validate = _compiled_validator("finance_ledger.schema.json")
+    return [validate(payload) for payload in payloads]
 
 
 def validate_investing_trade_ticket(payload: Dict[str, Any]) -> List[str]:
-    schema = load_schema("investing_trade_ticket.schema.json")
-    return validate_required_fields(payload, schema)
-
-
-def _matches_type(value: Any, expected_type: str) -> bool:
-    if expected_type == "string":
-        return isinstance(value, str)
-    if expected_type == "number":
-        return isinstance(value, (int, float)) and not isinstance(value, bool)
-    if expected_type == "object":
-        return isinstance(value, dict)
-    if expected_type == "array":
-        return isinstance(value, list)
-    if expected_type == "boolean":
-        return isinstance(value, bool)
-    return True
+    return _compiled_validator("investing_trade_ticket.schema.json")(payload)
+
+
+# Struct variants validate model instances directly. For bulk ingestion, build
+# the models once and validate those instead of round-tripping through
+# to_dict(): slot attribute reads skip the dict construction and key hashing.
+
+
+def validate_audit_event_struct(event: AuditEvent) -> List[str]:
+    return _compiled_struct_validator("audit_event.schema.json")(event)
+
+
+def validate_finance_ledger_entry_struct(entry: FinanceLedgerEntry) -> List[str]:
+    return _compiled_struct_validator("finance_ledger.schema.json")(entry)
+
+
+def validate_investing_trade_ticket_struct(ticket: InvestingTradeTicketDraft) -> List[str]:
+    return _compiled_struct_validator("investing_trade_ticket.schema.json")(ticket)
@@ -1,6 +1,6 @@
 import unittest
 
-from jx42.audit import InMemoryAuditLog, redact_text
+from jx42.audit import InMemoryAuditLog, _redact_event, redact_text
 from jx42.models import AuditEvent, PolicyDecisionType, RiskLevel
 
 
@@ -63,6 +63,30 @@ class TestAuditLog(unittest.TestCase):
         self.assertIn("token:[REDACTED]", redacted)
         self.assertIn("[REDACTED]", redacted)
 
+    def test_redaction_of_chained_keys(self) -> None:
+        # A secret whose value looks like another key must not leak what follows.
+        self.assertEqual("secret=[REDACTED] [REDACTED]", redact_text("secret=token: abc"))
+
+    def test_redaction_idempotent(self) -> None:
+        event = AuditEvent(
+            event_id="event-1",
+            timestamp="2026-01-01T00:00:00+00:00",
+            correlation_id="corr-1",
+            component="kernel",
+            action_type="plan_created",
+            risk_level=RiskLevel.LOW,
+            inputs_summary="api_key=abc123",
+            outputs_summary="plan",
+            policy_decision=PolicyDecisionType.ALLOW,
+            rationale="ok",
+        )
+        log = InMemoryAuditLog()
+        log.append(event)
+        stored = log.list_events()[0]
+        self.assertEqual("api_key=[REDACTED]", stored.inputs_summary)
+        # Re-appending an already-redacted event leaves it unchanged
+        self.assertIs(stored, _redact_event(stored))
+
 
 if __name__ == "__main__":
     unittest.main()
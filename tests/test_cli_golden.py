@@ -1,29 +1,42 @@
+import contextlib
+import io
 import subprocess
 import unittest
 
+from jx42.cli import main
+
+
+def _run_cli(argv: list[str]) -> tuple[int, str]:
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        code = main(argv)
+    return code, stdout.getvalue()
+
 
 class TestCLIGolden(unittest.TestCase):
     def test_cli_finance_request(self) -> None:
-        result = subprocess.run(
-            ["python3", "-m", "jx42.cli", "run", "Hey Jax, summarize my finances", "--seed", "42"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        self.assertEqual(0, result.returncode)
-        self.assertIn("correlation_id=", result.stdout)
-        self.assertIn("Draft finance summary stub", result.stdout)
+        code, stdout = _run_cli(["run", "Hey Jax, summarize my finances", "--seed", "42"])
+        self.assertEqual(0, code)
+        self.assertIn("correlation_id=", stdout)
+        self.assertIn("Draft finance summary stub", stdout)
 
     def test_cli_money_move_denied(self) -> None:
+        code, stdout = _run_cli(["run", "Hey Jax, move $500 to savings", "--seed", "42"])
+        self.assertEqual(0, code)
+        self.assertIn("correlation_id=", stdout)
+        self.assertIn("blocked", stdout.lower())
+
+    def test_cli_entrypoint_subprocess(self) -> None:
+        """Smoke test the real `python -m jx42.cli` entry point once."""
         result = subprocess.run(
-            ["python3", "-m", "jx42.cli", "run", "Hey Jax, move $500 to savings", "--seed", "42"],
+            ["python3", "-m", "jx42.cli", "run", "Hey Jax, summarize my finances", "--seed", "42"],
             capture_output=True,
             text=True,
             check=False,
         )
         self.assertEqual(0, result.returncode)
         self.assertIn("correlation_id=", result.stdout)
-        self.assertIn("blocked", result.stdout.lower())
+        self.assertIn("Draft finance summary stub", result.stdout)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,11 @@
 """Tests for the Investing Program — Milestone 2."""
 from __future__ import annotations
 
+import functools
+import io
 import unittest
+from datetime import date, timedelta
+from typing import Tuple
 
 from jx42.investing import (
     InvestingProgram,
@@ -17,23 +21,29 @@ from jx42.models import MarketDataPoint, StrategyDefinition, StrategyRule
 # Fixtures
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
+def _trading_dates(start: date, n: int) -> Tuple[str, ...]:
+    """First ``n`` weekdays on or after ``start``, as ISO date strings."""
+    dates = []
+    d = start
+    while len(dates) < n:
+        if d.weekday() < 5:  # skip weekends
+            dates.append(d.isoformat())
+        d += timedelta(days=1)
+    return tuple(dates)
+
+
 # 60 trading days of synthetic OHLCV for a single symbol (upward trend)
 def _make_market_csv(symbol: str = "TEST", n: int = 60, start_price: float = 100.0) -> str:
     rows = ["symbol,date,open,high,low,close,volume"]
     price = start_price
-    from datetime import date, timedelta
-
-    d = date(2026, 1, 2)
-    for i in range(n):
-        while d.weekday() >= 5:  # skip weekends
-            d += timedelta(days=1)
+    for d in _trading_dates(date(2026, 1, 2), n):
         o = round(price, 2)
         h = round(price * 1.01, 2)
         lo = round(price * 0.99, 2)
         c = round(price * 1.005, 2)  # slight upward drift
         rows.append(f"{symbol},{d},{o},{h},{lo},{c},1000000")
         price = c
-        d += timedelta(days=1)
     return "\n".join(rows)
 
 
@@ -83,6 +93,12 @@ class TestMarketDataLoading(unittest.TestCase):
         for p in points:
             self.assertEqual("TEST", p.symbol)
             self.assertGreater(p.close, 0)
+        # Symbols are interned: every point shares one string object.
+        self.assertIs(points[0].symbol, points[-1].symbol)
+
+    def test_load_from_stream(self) -> None:
+        csv_text = _make_market_csv(n=10)
+        self.assertEqual(load_market_data_csv(csv_text), load_market_data_csv(io.StringIO(csv_text)))
 
     def test_missing_volume_column(self) -> None:
         csv_text = "symbol,date,open,high,low,close\nTEST,2026-01-02,100,101,99,100.5"
@@ -98,6 +114,13 @@ class TestMarketDataLoading(unittest.TestCase):
         with self.assertRaises(MarketDataError):
             load_market_data_csv(csv_text)
 
+    def test_row_width_mismatch(self) -> None:
+        header = "symbol,date,open,high,low,close,volume\n"
+        with self.assertRaisesRegex(MarketDataError, "Row 1: expected 7 columns, got 8"):
+            load_market_data_csv(header + "TEST,2026-01-02,100,101,99,1,000.5,1000")
+        with self.assertRaisesRegex(MarketDataError, "Row 1: expected 7 columns, got 6"):
+            load_market_data_csv(header + "TEST,2026-01-02,100,101,99,100.5")
+
 
 # ---------------------------------------------------------------------------
 # Data integrity
@@ -177,8 +200,6 @@ class TestSignalEngine(unittest.TestCase):
         # Build data that drops sharply after a high
         rows = ["symbol,date,open,high,low,close,volume"]
         prices = [100, 105, 110, 108, 106, 80, 75]  # sharp drop
-        from datetime import date, timedelta
-
         d = date(2026, 1, 2)
         for p in prices:
             rows.append(f"TEST,{d},{p},{p*1.01},{p*0.99},{p},1000")
@@ -202,6 +223,17 @@ class TestSignalEngine(unittest.TestCase):
         exit_signals = [s for s in signals if s.signal_type == "exit"]
         self.assertGreater(len(exit_signals), 0)
 
+    def test_sma_exact_tie_is_not_a_cross(self) -> None:
+        # At bar 7 SMA(3) == SMA(7) == 92.4 exactly; the fast SMA only drops
+        # below the slow one at bar 8. A running window sum drifts enough to
+        # report the cross one bar early.
+        closes = [92.3, 92.3, 92.3, 92.5, 92.5, 92.3, 92.5, 92.4, 92.2]
+        dates = [f"2026-01-{day:02d}" for day in range(2, 2 + len(closes))]
+        points = [MarketDataPoint("TEST", d, c, c, c, c, 1000.0) for d, c in zip(dates, closes)]
+        signals = compute_signals(points, _make_strategy(fast_window=3, slow_window=7))
+        exits = [s.date for s in signals if s.signal_type == "exit"]
+        self.assertEqual([dates[8]], exits)
+
 
 # ---------------------------------------------------------------------------
 # Backtester
@@ -209,11 +241,14 @@ class TestSignalEngine(unittest.TestCase):
 
 
 class TestBacktester(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Parsed once and shared read-only; points are frozen dataclasses.
+        cls._points = load_market_data_csv(_make_market_csv(n=60))
+        cls._strategy = _make_strategy()
+
     def test_backtest_produces_result(self) -> None:
-        csv_text = _make_market_csv(n=60)
-        points = load_market_data_csv(csv_text)
-        strategy = _make_strategy()
-        result = run_backtest(points, strategy, initial_capital=10_000.0)
+        result = run_backtest(self._points, self._strategy, initial_capital=10_000.0)
         self.assertIsNotNone(result.summary)
         self.assertIsInstance(result.trades, list)
         self.assertIsInstance(result.total_return, float)
@@ -223,25 +258,22 @@ class TestBacktester(unittest.TestCase):
 
     def test_no_look_ahead_bias(self) -> None:
         """Entry executes at next-day open, not signal-day close."""
-        csv_text = _make_market_csv(n=60)
-        points = load_market_data_csv(csv_text)
-        strategy = _make_strategy()
-        result = run_backtest(points, strategy, initial_capital=10_000.0)
+        result = run_backtest(self._points, self._strategy, initial_capital=10_000.0)
         # All entry prices should be open prices; simply verify no exception and valid result
         self.assertIsNotNone(result)
 
     def test_kill_switch_respected(self) -> None:
         """A strategy with a tight drawdown limit should trigger kill-switch on extreme losses."""
         # Create data with a severe crash
-        rows = ["symbol,date,open,high,low,close,volume"]
-        prices = list(range(100, 160)) + list(range(159, 50, -3))  # up then crash
-        from datetime import date, timedelta
-
-        d = date(2026, 1, 2)
-        for p in prices:
-            rows.append(f"TEST,{d},{p},{int(p*1.02)},{int(p*0.98)},{p},1000000")
-            d += timedelta(days=1)
-        csv_text = "\n".join(rows)
+        prices = [*range(100, 160), *range(159, 50, -3)]  # up then crash
+        start = date(2026, 1, 2)
+        csv_text = "\n".join([
+            "symbol,date,open,high,low,close,volume",
+            *(
+                f"TEST,{start + timedelta(days=i)},{p},{p * 102 // 100},{p * 98 // 100},{p},1000000"
+                for i, p in enumerate(prices)
+            ),
+        ])
         points = load_market_data_csv(csv_text)
         strategy = StrategyDefinition(
             strategy_id="s_kill",
@@ -262,18 +294,35 @@ class TestBacktester(unittest.TestCase):
 
     def test_repeatable_outputs(self) -> None:
         """Same inputs => same outputs."""
-        csv_text = _make_market_csv(n=60)
-        points = load_market_data_csv(csv_text)
-        strategy = _make_strategy()
-        result1 = run_backtest(points, strategy, initial_capital=10_000.0)
-        result2 = run_backtest(points, strategy, initial_capital=10_000.0)
+        result1 = run_backtest(self._points, self._strategy, initial_capital=10_000.0)
+        result2 = run_backtest(self._points, self._strategy, initial_capital=10_000.0)
         self.assertEqual(result1.total_return, result2.total_return)
         self.assertEqual(result1.num_trades, result2.num_trades)
 
+    def test_parallel_matches_serial(self) -> None:
+        points = [
+            *self._points,
+            *load_market_data_csv(_make_market_csv(symbol="OTHER", n=60, start_price=50.0)),
+        ]
+        strategy = StrategyDefinition(
+            strategy_id="s_multi",
+            name="Multi-symbol breakout",
+            version="1.0",
+            universe=["TEST", "OTHER"],
+            rules=[StrategyRule("r_entry", "breakout entry", "entry", {"indicator": "breakout", "window": 5})],
+            max_position_size=0.5,
+            max_open_positions=2,
+        )
+        serial = run_backtest(points, strategy, initial_capital=10_000.0)
+        parallel = run_backtest(points, strategy, initial_capital=10_000.0, parallel=True)
+        self.assertEqual({"TEST", "OTHER"}, {trade.symbol for trade in serial.trades})
+        self.assertEqual(serial.trades, parallel.trades)
+        self.assertEqual(serial.total_return, parallel.total_return)
+
     def test_tickets_respect_position_size(self) -> None:
         ip = InvestingProgram()
-        ip.load_market_csv(_make_market_csv(n=60))
-        strategy = _make_strategy()
+        ip.set_market_data(self._points)
+        strategy = self._strategy
         ip.add_strategy(strategy)
         tickets = ip.draft_tickets(strategy.strategy_id, portfolio_value=100_000.0)
         for ticket in tickets:
@@ -288,10 +337,14 @@ class TestBacktester(unittest.TestCase):
 
 
 class TestInvestingProgram(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._csv = _make_market_csv(n=60)
+        cls._points = load_market_data_csv(cls._csv)
+
     def test_full_pipeline(self) -> None:
         ip = InvestingProgram()
-        csv_text = _make_market_csv(n=60)
-        points = ip.load_market_csv(csv_text)
+        points = ip.load_market_csv(self._csv)
         self.assertEqual(60, len(points))
 
         errors = ip.check_integrity()
@@ -311,6 +364,20 @@ class TestInvestingProgram(unittest.TestCase):
         for t in tickets:
             self.assertEqual("draft", t.status)
 
+    def test_set_market_data_matches_csv_load(self) -> None:
+        strategy = _make_strategy()
+        loaded = InvestingProgram()
+        loaded.load_market_csv(self._csv)
+        loaded.add_strategy(strategy)
+        preset = InvestingProgram()
+        preset.set_market_data(self._points)
+        preset.add_strategy(strategy)
+        self.assertEqual(loaded.signals(strategy.strategy_id), preset.signals(strategy.strategy_id))
+        self.assertEqual(
+            loaded.backtest(strategy.strategy_id).total_return,
+            preset.backtest(strategy.strategy_id).total_return,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
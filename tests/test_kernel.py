@@ -8,6 +8,17 @@ from jx42.models import Intent, Plan, ToolCall, UserRequest
 from jx42.policy import DefaultPolicyGuardian
 
 
+class _BatchRecordingAuditLog(InMemoryAuditLog):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batch_sizes: list[int] = []
+
+    def append_many(self, events):  # type: ignore[override]
+        events = list(events)
+        self.batch_sizes.append(len(events))
+        return super().append_many(events)
+
+
 class TestKernel(unittest.TestCase):
     def setUp(self) -> None:
         self.guardian = DefaultPolicyGuardian()
@@ -84,6 +95,29 @@ class TestKernel(unittest.TestCase):
             self.assertGreater(len(policy_events), 0)
             self.assertEqual("deny", policy_events[0].policy_decision.value)
 
+    def test_audit_events_flushed_as_one_batch(self) -> None:
+        audit = _BatchRecordingAuditLog()
+        kernel = DefaultKernel(
+            policy_guardian=self.guardian,
+            memory_librarian=self.librarian,
+            audit_log=audit,
+        )
+        response = kernel.handle_request(UserRequest(text="Hey Jax, summarize my finances"))
+        self.assertEqual([3], audit.batch_sizes)
+        self.assertEqual(response.audit_event_ids, [e.event_id for e in audit.list_events()])
+
+    def test_audit_events_flushed_on_error(self) -> None:
+        kernel = DefaultKernel(
+            policy_guardian=self.guardian,
+            memory_librarian=self.librarian,
+            audit_log=self.audit,
+        )
+        with patch.object(kernel, "_build_response", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                kernel.handle_request(UserRequest(text="test"))
+        actions = [e.action_type for e in self.audit.list_events()]
+        self.assertEqual(["plan_created", "policy_decision"], actions)
+
 
 if __name__ == "__main__":
     unittest.main()
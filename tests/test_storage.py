@@ -1,12 +1,14 @@
 """Tests for SQLite-backed persistent storage."""
 from __future__ import annotations
 
+import sqlite3
 import tempfile
+import threading
 import unittest
 from pathlib import Path
 
 from jx42.models import AuditEvent, MemoryItem, PolicyDecisionType, RiskLevel
-from jx42.storage import SqliteAuditLog, SqliteMemoryLibrarian
+from jx42.storage import _MEMORY_DDL, SqliteAuditLog, SqliteMemoryLibrarian
 
 
 def _make_event(event_id: str = "e1", correlation_id: str = "c1") -> AuditEvent:
@@ -59,6 +61,12 @@ class TestSqliteAuditLog(unittest.TestCase):
         self.assertEqual(1, len(events))
         self.assertEqual("e1", events[0].event_id)
 
+    def test_append_many(self) -> None:
+        log = SqliteAuditLog(self._db)
+        ids = log.append_many([_make_event("e1", "c1"), _make_event("e2", "c1"), _make_event("e1", "c1")])
+        self.assertEqual(["e1", "e2", "e1"], ids)
+        self.assertEqual(["e1", "e2"], [e.event_id for e in log.list_events()])
+
     def test_idempotent_append(self) -> None:
         """Appending the same event twice should not create a duplicate."""
         log = SqliteAuditLog(self._db)
@@ -102,6 +110,33 @@ class TestSqliteAuditLog(unittest.TestCase):
         self.assertEqual(e.policy_decision, stored.policy_decision)
         self.assertEqual(e.rationale, stored.rationale)
 
+    def test_maintenance_preserves_events(self) -> None:
+        log = SqliteAuditLog(self._db)
+        log.append(_make_event("e1"))
+        log.maintenance()
+        self.assertEqual(["e1"], [e.event_id for e in log.list_events()])
+
+    def test_shared_connection_across_threads(self) -> None:
+        log = SqliteAuditLog(self._db)
+        threads = [
+            threading.Thread(target=log.append_many, args=([_make_event(f"e{t}-{i}") for i in range(20)],))
+            for t in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(80, len(log.list_events()))
+
+    def test_close(self) -> None:
+        log = SqliteAuditLog(self._db)
+        log.append(_make_event("e1"))
+        log.close()
+        log.close()  # idempotent
+        with self.assertRaises(sqlite3.ProgrammingError):
+            log.list_events()
+        self.assertEqual(["e1"], [e.event_id for e in SqliteAuditLog(self._db).list_events()])
+
 
 class TestSqliteMemoryLibrarian(unittest.TestCase):
     def setUp(self) -> None:
@@ -187,6 +222,30 @@ class TestSqliteMemoryLibrarian(unittest.TestCase):
         self.assertEqual(1, len(items))
         self.assertEqual("m1", items[0].item_id)
 
+    def test_query_matches_substrings(self) -> None:
+        """Full-text lookup keeps case-insensitive substring semantics, short queries included."""
+        lib = SqliteMemoryLibrarian(self._db)
+        lib.store([
+            MemoryItem("m1", "2026-01-02T00:00:00+00:00", "goal", "Retire at 62", "user"),
+            MemoryItem("m2", "2026-01-01T00:00:00+00:00", "note", "tired of \"budget\" talk", "user"),
+        ])
+        self.assertEqual(["m2", "m1"], [i.item_id for i in lib.retrieve(query="TIRE")])
+        self.assertEqual(["m1"], [i.item_id for i in lib.retrieve(query="62")])
+        self.assertEqual(["m2"], [i.item_id for i in lib.retrieve(query='"budget"')])
+        self.assertEqual([], lib.retrieve(query="retirement"))
+
+    def test_index_covers_rows_written_before_it_existed(self) -> None:
+        conn = sqlite3.connect(self._db)
+        conn.executescript(_MEMORY_DDL)
+        conn.execute(
+            "INSERT INTO memory_items VALUES (?, ?, ?, ?, ?)",
+            ("m1", "2026-01-01T00:00:00+00:00", "goal", "retire at 62", "user"),
+        )
+        conn.commit()
+        conn.close()
+        lib = SqliteMemoryLibrarian(self._db)
+        self.assertEqual(["m1"], [i.item_id for i in lib.retrieve(query="retire")])
+
 
 class TestSqliteFinanceLedger(unittest.TestCase):
     def setUp(self) -> None:
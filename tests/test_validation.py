@@ -1,60 +1,128 @@
+import json
 import unittest
 
-from jx42.validation import validate_audit_event, validate_finance_ledger_entry, validate_investing_trade_ticket
+from jx42.models import AuditEvent, FinanceLedgerEntry, InvestingTradeTicketDraft, PolicyDecisionType, RiskLevel
+from jx42.validation import (
+    compile_schema,
+    validate_audit_event,
+    validate_audit_event_bytes,
+    validate_audit_event_struct,
+    validate_audit_events_batch,
+    validate_finance_ledger_entries_batch,
+    validate_finance_ledger_entry,
+    validate_finance_ledger_entry_struct,
+    validate_investing_trade_ticket,
+    validate_investing_trade_ticket_struct,
+    validate_required_fields,
+)
+
+_VALID_AUDIT = {
+    "event_id": "test-1",
+    "timestamp": "2026-01-01T00:00:00+00:00",
+    "correlation_id": "corr-1",
+    "component": "kernel",
+    "action_type": "plan_created",
+    "risk_level": "low",
+    "policy_decision": "allow",
+}
+_PARTIAL_AUDIT = {"event_id": "test-1", "timestamp": "2026-01-01T00:00:00+00:00"}
+_VALID_FINANCE = {
+    "entry_id": "entry-1",
+    "date": "2026-01-01",
+    "amount": 100.0,
+    "currency": "USD",
+    "account_id": "checking",
+    "source": "bank_export",
+    "import_batch_id": "batch-1",
+}
+_VALID_TICKET = {
+    "ticket_id": "ticket-1",
+    "created_at": "2026-01-01T00:00:00+00:00",
+    "symbol": "AAPL",
+    "side": "buy",
+    "order_type": "limit",
+    "strategy_version": "v1",
+    "status": "draft",
+}
+_PARTIAL_TICKET = {"ticket_id": "ticket-1", "symbol": "AAPL"}
 
 
 class TestValidation(unittest.TestCase):
-    def test_audit_event_valid(self) -> None:
-        payload = {
-            "event_id": "test-1",
-            "timestamp": "2026-01-01T00:00:00+00:00",
-            "correlation_id": "corr-1",
-            "component": "kernel",
-            "action_type": "plan_created",
-            "risk_level": "low",
-            "policy_decision": "allow",
-        }
-        errors = validate_audit_event(payload)
-        self.assertEqual([], errors)
+    def test_valid_payloads(self) -> None:
+        cases = [
+            (validate_audit_event, _VALID_AUDIT),
+            (validate_finance_ledger_entry, _VALID_FINANCE),
+            (validate_investing_trade_ticket, _VALID_TICKET),
+        ]
+        for validator, payload in cases:
+            with self.subTest(validator=validator.__name__):
+                self.assertEqual([], validator(payload))
 
     def test_audit_event_missing_field(self) -> None:
-        payload = {
-            "event_id": "test-1",
-            "timestamp": "2026-01-01T00:00:00+00:00",
-        }
-        errors = validate_audit_event(payload)
-        self.assertIn("Missing required field: correlation_id", errors)
-
-    def test_finance_entry_valid(self) -> None:
-        payload = {
-            "entry_id": "entry-1",
-            "date": "2026-01-01",
-            "amount": 100.0,
-            "currency": "USD",
-            "account_id": "checking",
-            "source": "bank_export",
-            "import_batch_id": "batch-1",
-        }
-        errors = validate_finance_ledger_entry(payload)
-        self.assertEqual([], errors)
-
-    def test_investing_trade_ticket_valid(self) -> None:
-        payload = {
-            "ticket_id": "ticket-1",
-            "created_at": "2026-01-01T00:00:00+00:00",
-            "symbol": "AAPL",
-            "side": "buy",
-            "order_type": "limit",
-            "strategy_version": "v1",
-            "status": "draft",
-        }
-        errors = validate_investing_trade_ticket(payload)
-        self.assertEqual([], errors)
+        errors = validate_audit_event(_PARTIAL_AUDIT)
+        # Validators report missing fields in schema order.
+        self.assertEqual(
+            [
+                "Missing required field: correlation_id",
+                "Missing required field: component",
+                "Missing required field: action_type",
+                "Missing required field: risk_level",
+                "Missing required field: policy_decision",
+            ],
+            errors,
+        )
+
+    def test_audit_event_bytes(self) -> None:
+        self.assertEqual([], validate_audit_event_bytes(json.dumps(_VALID_AUDIT).encode()))
+        self.assertEqual(["Payload must be a JSON object"], validate_audit_event_bytes(b"[]"))
+        self.assertTrue(validate_audit_event_bytes(b"{not json")[0].startswith("Invalid JSON payload"))
+        self.assertTrue(validate_audit_event_bytes(b"[" * 200000)[0].startswith("Invalid JSON payload"))
+
+    def test_audit_events_batch(self) -> None:
+        results = validate_audit_events_batch([_VALID_AUDIT, _PARTIAL_AUDIT, _VALID_AUDIT])
+        self.assertEqual([validate_audit_event(p) for p in (_VALID_AUDIT, _PARTIAL_AUDIT, _VALID_AUDIT)], results)
+        self.assertEqual([], results[0])
+        self.assertIn("Missing required field: component", results[1])
+
+    def test_finance_ledger_entries_batch(self) -> None:
+        bad_amount = dict(_VALID_FINANCE, amount="100.00")
+        payloads = [_VALID_FINANCE, bad_amount, {"entry_id": "entry-2"}]
+        results = validate_finance_ledger_entries_batch(payloads)
+        self.assertEqual([validate_finance_ledger_entry(p) for p in payloads], results)
+        self.assertEqual([], results[0])
+        self.assertEqual(["Field amount expected number"], results[1])
+        self.assertIn("Missing required field: amount", results[2])
 
     def test_investing_trade_ticket_missing_field(self) -> None:
-        payload = {"ticket_id": "ticket-1", "symbol": "AAPL"}
-        errors = validate_investing_trade_ticket(payload)
-        self.assertIn("Missing required field: created_at", errors)
+        errors = validate_investing_trade_ticket(_PARTIAL_TICKET)
+        self.assertEqual(
+            [
+                "Missing required field: created_at",
+                "Missing required field: side",
+                "Missing required field: order_type",
+                "Missing required field: strategy_version",
+                "Missing required field: status",
+            ],
+            errors,
+        )
+
+    def test_union_type_is_not_checked(self) -> None:
+        # Types other than the five known names (e.g. JSON Schema unions) pass unchecked.
+        schema = {"properties": {"note": {"type": ["string", "null"]}}}
+        self.assertEqual([], validate_required_fields({"note": None}, schema))
+        self.assertEqual([], compile_schema(schema)({"note": None}))
+
+    def test_struct_validators(self) -> None:
+        event = AuditEvent(
+            "test-1", "2026-01-01T00:00:00+00:00", "corr-1", "kernel", "plan_created",
+            RiskLevel.LOW, "in", "out", PolicyDecisionType.ALLOW, "ok",
+        )
+        self.assertEqual([], validate_audit_event_struct(event))
+        entry = FinanceLedgerEntry("entry-1", "2026-01-01", 100.0, "USD", "checking", category_confidence=2.0)
+        self.assertEqual(["Field category_confidence must be <= 1"], validate_finance_ledger_entry_struct(entry))
+        # Unset Optional fields (qty, notional, ...) are treated as absent, not as type errors.
+        ticket = InvestingTradeTicketDraft("ticket-1", "2026-01-01T00:00:00+00:00", "AAPL", "hold", "limit", "v1")
+        self.assertEqual(["Field side must be one of ['buy', 'sell']"], validate_investing_trade_ticket_struct(ticket))
 
 
 if __name__ == "__main__":